@@ -1,15 +1,14 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import math
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pygeomtools
 from dbetto import AttrsDict
-from git import GitCommandError
-from legendmeta import HadesMetadata, LegendMetadata
-from matplotlib import pyplot as plt
 from pyg4ometry import geant4
 from pygeomhpges import make_hpge
 
@@ -19,9 +18,27 @@ from . import plot
 from .metadata import PublicHadesMetadataProxy, PublicLegendMetadataProxy
 from .utils import get_profile, merge_configs, parse_measurement
 
+if TYPE_CHECKING:
+    from legendmeta import HadesMetadata, LegendMetadata
+
 log = logging.getLogger(__name__)
 
 
+@functools.cache
+def _load_metadata() -> tuple[LegendMetadata, HadesMetadata]:
+    """Instantiate the LEGEND and HADES metadata once per process.
+
+    Failures (e.g. :class:`git.GitCommandError`) are not cached, so access is
+    retried on the next call. Use ``_load_metadata.cache_clear()`` to force
+    a reload.
+    """
+    # legendmeta (and git) are slow to import and not needed for public
+    # geometries
+    from legendmeta import HadesMetadata, LegendMetadata
+
+    return LegendMetadata(lazy=True), HadesMetadata(lazy=True)
+
+
 def _place_pv(
     lv: geant4.LogicalVolume,
     name: str,
@@ -33,12 +50,17 @@ def _place_pv(
     z_in_mm: float = 0,
     x_rot: float = 0,
     invert_z_axes: bool = False,
+    from_gdml: bool = False,
 ) -> geant4.PhysicalVolume:
-    """Wrapper to place the physical volume more concisely."""
+    """Wrapper to place the physical volume more concisely.
+
+    If `from_gdml` is true, the volume was read from GDML into its own
+    registry and its volume tree is transferred to `reg`.
+    """
 
     rot = [0, np.pi, 0, "rad"] if invert_z_axes else [x_rot, 0, 0, "rad"]
 
-    return geant4.PhysicalVolume(
+    pv = geant4.PhysicalVolume(
         rot,
         [x_in_mm, y_in_mm, z_in_mm, "mm"],
         lv,
@@ -47,11 +69,17 @@ def _place_pv(
         registry=reg,
     )
 
+    if from_gdml:
+        reg.addVolumeRecursive(pv)
+
+    return pv
+
 
 def construct(
     config: AttrsDict,
     public_geometry: bool = False,
     plot_profiles: bool = False,
+    world_size_in_m: float = 20,
 ) -> geant4.Registry:
     """Construct the HADES geometry.
 
@@ -80,7 +108,16 @@ def construct(
       legend-metadata.
     plot_profiles
         if true, plots the profiles of the volumes in the geometry using matplotlib.
+    world_size_in_m
+        side length of the (vacuum) world box. The air-filled lab box fills 90%
+        of it. Smaller values reduce the amount of air that has to be tracked
+        in the simulation, but the lab must still contain all placed volumes
+        (the bottom plate is 0.75 m wide), otherwise a :class:`ValueError` is
+        raised.
     """
+    if world_size_in_m <= 0:
+        msg = f"world_size_in_m must be positive, not {world_size_in_m}"
+        raise ValueError(msg)
 
     profiles = {}
     hpge_name = config.detector
@@ -92,9 +129,10 @@ def construct(
     lmeta = None
     hmeta = None
     if not public_geometry:
+        from git import GitCommandError
+
         with contextlib.suppress(GitCommandError):
-            lmeta = LegendMetadata(lazy=True)
-            hmeta = HadesMetadata(lazy=True)
+            lmeta, hmeta = _load_metadata()
 
     # require user action to construct a testdata-only geometry (i.e. to avoid
     # accidental creation of "wrong" geometries by LEGEND members).
@@ -113,18 +151,34 @@ def construct(
     position = measurement_info.position
     source_type = measurement_info.source
 
+    # check the source request before building anything
+    if "source_position" in config:
+        if source_pos is None:
+            msg = (
+                "requested a geometry with source but no "
+                "source position information was provided"
+            )
+            raise RuntimeError(msg)
+
+        if source_type not in {"am_HS1", "th_HS2"} and position == "lat":
+            msg = f"lateral position not implemented for source type {source_type}"
+            raise NotImplementedError(msg)
+
     diode_meta = lmeta.hardware.detectors.germanium.diodes[hpge_name]
     hpge_meta = merge_configs(diode_meta, hmeta.hardware.cryostat[hpge_name])
 
     reg = geant4.Registry()
 
     # Create the world volume
-    world = geant4.solid.Box("world", 20, 20, 20, reg, "m")
+    world = geant4.solid.Box(
+        "world", world_size_in_m, world_size_in_m, world_size_in_m, reg, "m"
+    )
     world_lv = geant4.LogicalVolume(world, "G4_Galactic", "world_lv", reg)
     reg.setWorld(world_lv)
 
     # place a box rotated 180 deg so the geometry is not upside down
-    lab = geant4.solid.Box("lab", 18, 18, 18, reg, "m")
+    lab_size_in_m = 0.9 * world_size_in_m
+    lab = geant4.solid.Box("lab", lab_size_in_m, lab_size_in_m, lab_size_in_m, reg, "m")
     lab_lv = geant4.LogicalVolume(lab, "G4_AIR", "lab_lv", reg)
     lab_lv.pygeom_color_rgba = False
 
@@ -138,30 +192,22 @@ def construct(
     cavity_lv = create.create_vacuum_cavity(cryostat_meta, reg)
     cavity_lv.pygeom_color_rgba = False
 
+    # the volumes inside the cavity are placed relative to its top
+    cavity_z_pos = cryostat_meta.position_cavity_from_top
+
     # save the info for plotting
-    profiles["cavity"] = get_profile(cavity_lv.solid) | {
-        "offset": cryostat_meta.position_cavity_from_top
-    }
+    profiles["cavity"] = get_profile(cavity_lv.solid) | {"offset": cavity_z_pos}
 
-    _place_pv(
-        cavity_lv,
-        "cavity_pv",
-        lab_lv,
-        reg,
-        z_in_mm=cryostat_meta.position_cavity_from_top,
-    )
+    _place_pv(cavity_lv, "cavity_pv", lab_lv, reg, z_in_mm=cavity_z_pos)
 
     # construct the mylar wrap
     wrap_lv = create.create_wrap(hpge_meta.hades.wrap.geometry, from_gdml=True)
     wrap_lv.pygeom_color_rgba = [1.0, 1.0, 1.0, 0.8]
 
-    z_pos = hpge_meta.hades.wrap.position - cryostat_meta.position_cavity_from_top
-    pv = _place_pv(wrap_lv, "wrap_pv", cavity_lv, reg, z_in_mm=z_pos)
+    z_pos = hpge_meta.hades.wrap.position - cavity_z_pos
+    _place_pv(wrap_lv, "wrap_pv", cavity_lv, reg, z_in_mm=z_pos, from_gdml=True)
 
-    profiles["wrap"] = get_profile(wrap_lv.solid) | {
-        "offset": z_pos + profiles["cavity"]["offset"]
-    }
-    reg.addVolumeRecursive(pv)
+    profiles["wrap"] = get_profile(wrap_lv.solid) | {"offset": z_pos + cavity_z_pos}
 
     # construct the holder
     holder_lv = create.create_holder(
@@ -172,13 +218,10 @@ def construct(
     )
     holder_lv.pygeom_color_rgba = [0.0, 0.8, 0.2, 0.8]
 
-    z_pos = hpge_meta.hades.holder.position - cryostat_meta.position_cavity_from_top
-    pv = _place_pv(holder_lv, "holder_pv", cavity_lv, reg, z_in_mm=z_pos)
-    reg.addVolumeRecursive(pv)
+    z_pos = hpge_meta.hades.holder.position - cavity_z_pos
+    _place_pv(holder_lv, "holder_pv", cavity_lv, reg, z_in_mm=z_pos, from_gdml=True)
 
-    profiles["holder"] = get_profile(holder_lv.solid) | {
-        "offset": z_pos + profiles["cavity"]["offset"]
-    }
+    profiles["holder"] = get_profile(holder_lv.solid) | {"offset": z_pos + cavity_z_pos}
 
     # construct the hpge, for now do not allow cylindrical asymmetry
     detector_lv = make_hpge(
@@ -190,11 +233,7 @@ def construct(
     # this is the top of the crystal in the original GDML but it's the p+ contact here
 
     extra_offset = max(detector_lv.get_profile()[1])
-    z_pos = (
-        hpge_meta.hades.detector.position
-        - cryostat_meta.position_cavity_from_top
-        + extra_offset
-    )
+    z_pos = hpge_meta.hades.detector.position - cavity_z_pos + extra_offset
 
     # we need to flip the detector axes when placing it in the cryostat
     pv = _place_pv(
@@ -202,7 +241,7 @@ def construct(
     )
 
     profiles["detector"] = get_profile(detector_lv.solid, flip=True) | {
-        "offset": z_pos + profiles["cavity"]["offset"]
+        "offset": z_pos + cavity_z_pos
     }
 
     # register the detector info for remage
@@ -217,23 +256,10 @@ def construct(
     cryo_lv = create.create_cryostat(cryostat_meta, from_gdml=True)
     cryo_lv.pygeom_color_rgba = [0.0, 0.2, 0.8, 0.5]
 
-    pv = _place_pv(cryo_lv, "cryo_pv", lab_lv, reg)
+    _place_pv(cryo_lv, "cryo_pv", lab_lv, reg, from_gdml=True)
     profiles["cryo"] = get_profile(cryo_lv.solid) | {"offset": 0}
 
-    reg.addVolumeRecursive(pv)
-
     if "source_position" in config:
-        if source_pos is None:
-            msg = (
-                "requested a geometry with source but no "
-                "source position information was provided"
-            )
-            raise RuntimeError(msg)
-
-        if source_type not in ["am_HS1", "th_HS2"] and position == "lat":
-            msg = f"lateral position not implemented for source type {source_type}"
-            raise NotImplementedError(msg)
-
         source_dims = dim.get_source_metadata(source_type, position)
         holder_dims = dim.get_source_holder_metadata(source_type, position)
 
@@ -267,10 +293,14 @@ def construct(
 
                 # add plate
                 th_plate_lv = create.create_th_plate(source_dims, from_gdml=True)
-                pv = _place_pv(
-                    th_plate_lv, "th_plate_pv", lab_lv, reg, z_in_mm=z_pos_plates
+                _place_pv(
+                    th_plate_lv,
+                    "th_plate_pv",
+                    lab_lv,
+                    reg,
+                    z_in_mm=z_pos_plates,
+                    from_gdml=True,
                 )
-                reg.addVolumeRecursive(pv)
 
             elif position == "lat":  # lat
                 source_y_pos = (
@@ -293,7 +323,7 @@ def construct(
             msg = f" Source type {source_type} not implemented."
             raise NotImplementedError(msg)
 
-        pv = _place_pv(
+        _place_pv(
             source_lv,
             "source_pv",
             lab_lv,
@@ -302,8 +332,8 @@ def construct(
             y_in_mm=source_y_pos,
             z_in_mm=source_z_pos,
             x_rot=0 if (position != "lat" or source_type != "th_HS2") else -np.pi / 2,
+            from_gdml=True,
         )
-        reg.addVolumeRecursive(pv)
         reg.logicalVolumeDict[source_lv.name].pygeom_color_rgba = [
             0.66,
             0.44,
@@ -322,10 +352,14 @@ def construct(
             )
             s_holder_lv.pygeom_color_rgba = [0, 1, 1, 0.5]
 
-            pv = _place_pv(
-                s_holder_lv, "source_holder_pv", lab_lv, reg, z_in_mm=z_pos_holder
+            _place_pv(
+                s_holder_lv,
+                "source_holder_pv",
+                lab_lv,
+                reg,
+                z_in_mm=z_pos_holder,
+                from_gdml=True,
             )
-            reg.addVolumeRecursive(pv)
 
     # construct lead castle and bottom plate
 
@@ -335,8 +369,7 @@ def construct(
         plate_lv.pygeom_color_rgba = [0.2, 0.3, 0.5, 0.05]
 
         z_pos = cryostat_meta.position_from_bottom + plate_meta.height / 2.0
-        pv = _place_pv(plate_lv, "plate_pv", lab_lv, reg, z_in_mm=z_pos)
-        reg.addVolumeRecursive(pv)
+        _place_pv(plate_lv, "plate_pv", lab_lv, reg, z_in_mm=z_pos, from_gdml=True)
 
         # FIXME:
         # it seems that at the beginning, when tables 1 and 2 were still
@@ -358,13 +391,21 @@ def construct(
         castle_lv.pygeom_color_rgba = [0.2, 0.3, 0.5, 0.05]
 
         z_pos = cryostat_meta.position_from_bottom - castle_dims.base.height / 2.0
-        pv = _place_pv(castle_lv, "castle_pv", lab_lv, reg, z_in_mm=z_pos)
-        reg.addVolumeRecursive(pv)
+        _place_pv(castle_lv, "castle_pv", lab_lv, reg, z_in_mm=z_pos, from_gdml=True)
+
+    # all the volumes must fit into the lab
+    lab_extent = np.abs(lab_lv.extent(includeBoundingSolid=False)).max()
+    if lab_extent > lab_size_in_m * 1000 / 2:
+        msg = (
+            f"the geometry extends {lab_extent / 1000:.3f} m from the center, it does "
+            f"not fit into the lab ({lab_size_in_m:.3f} m wide) for "
+            f"world_size_in_m={world_size_in_m}"
+        )
+        raise ValueError(msg)
 
     # plot the profiles
     if plot_profiles:
-        _, _ = plot.plot_profiles(profiles, title=f"{hpge_name}")
-        plt.show()
+        _, _ = plot.plot_profiles(profiles, title=f"{hpge_name}", show=True)
 
     return reg
 
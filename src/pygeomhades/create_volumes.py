@@ -8,6 +8,8 @@ from pyg4ometry import geant4
 
 from .utils import read_gdml_with_replacements
 
+_DUMMY_DIR = resources.files("pygeomhades") / "models" / "dummy"
+
 
 def create_vacuum_cavity(
     cryostat_metadata: AttrsDict, registry: geant4.Registry
@@ -49,7 +51,7 @@ def create_vacuum_cavity(
         "vacuum_cavity",
         0.0,
         2.0 * np.pi,
-        pR=([0.0, vacuum_cavity_radius, vacuum_cavity_radius, 0.0]),
+        pR=[0.0, vacuum_cavity_radius, vacuum_cavity_radius, 0.0],
         pZ=[0.0, 0.0, vacuum_cavity_z, vacuum_cavity_z],
         lunit="mm",
         aunit="rad",
@@ -88,16 +90,16 @@ def create_wrap(
         whether to read the geometry from GDML or construct it directly.
     """
     if from_gdml:
-        dummy_gdml_path = (
-            resources.files("pygeomhades") / "models" / "dummy" / "wrap_dummy.gdml"
-        )
+        dummy_gdml_path = _DUMMY_DIR / "wrap_dummy.gdml"
+
+        outer = wrap_metadata.outer
+        inner = wrap_metadata.inner
 
         replacements = {
-            "wrap_outer_height_in_mm": wrap_metadata.outer.height_in_mm,
-            "wrap_outer_radius_in_mm": wrap_metadata.outer.radius_in_mm,
-            "wrap_inner_radius_in_mm": wrap_metadata.inner.radius_in_mm,
-            "wrap_top_thickness_in_mm": wrap_metadata.outer.height_in_mm
-            - wrap_metadata.inner.height_in_mm,
+            "wrap_outer_height_in_mm": outer.height_in_mm,
+            "wrap_outer_radius_in_mm": outer.radius_in_mm,
+            "wrap_inner_radius_in_mm": inner.radius_in_mm,
+            "wrap_top_thickness_in_mm": outer.height_in_mm - inner.height_in_mm,
         }
         wrap_lv = read_gdml_with_replacements(dummy_gdml_path, replacements)
     else:
@@ -159,7 +161,7 @@ def create_holder(
         name = (
             "holder_icpc_batch_6_dummy.gdml" if order == 6 else "holder_icpc_dummy.gdml"
         )
-        dummy_gdml_path = resources.files("pygeomhades") / "models" / "dummy" / name
+        dummy_gdml_path = _DUMMY_DIR / name
 
         cylinder = holder_meta["cylinder"]
         bottom_cylinder = holder_meta["bottom_cyl"]
@@ -195,12 +197,7 @@ def create_holder(
             replacements["max_radius_in_mm"] = cylinder.outer.radius_in_mm
 
     elif det_type == "bege":
-        dummy_gdml_path = (
-            resources.files("pygeomhades")
-            / "models"
-            / "dummy"
-            / "holder_bege_dummy.gdml"
-        )
+        dummy_gdml_path = _DUMMY_DIR / "holder_bege_dummy.gdml"
 
         rings = holder_meta["rings"]
         cylinder = holder_meta["cylinder"]
@@ -235,13 +232,16 @@ def create_bottom_plate(
 
         .. code-block:: yaml
 
-            width: 100
-            depth: 200
-            height: 300
+            width: 750
+            depth: 750
+            height: 15
             cavity:
-                width: 100
-                depth: 200
-                height: 200
+                width: 120
+                depth: 940
+                height: 20
+
+        The cavity is centered on the edge of the plate at +y, and must cut
+        through the full height of the plate, leaving a U-shaped plate.
     from_gdml
         Whether to construct from a GDML file
 
@@ -250,21 +250,85 @@ def create_bottom_plate(
         msg = "cannot construct geometry without the gdml for now"
         raise NotImplementedError(msg)
 
-    dummy_gdml_path = (
-        resources.files("pygeomhades") / "models" / "dummy" / "bottom_plate_dummy.gdml"
-    )
+    cavity = plate_metadata.cavity
+
+    # the plate is extruded from a U-shaped outline
+    if (
+        cavity.height < plate_metadata.height
+        or cavity.width >= plate_metadata.width
+        or cavity.depth >= 2 * plate_metadata.depth
+    ):
+        msg = "the cavity must cut through the height of the bottom plate, but not split it"
+        raise ValueError(msg)
+
+    dummy_gdml_path = _DUMMY_DIR / "bottom_plate_dummy.gdml"
 
     replacements = {
         "bottom_plate_width": plate_metadata.width,
         "bottom_plate_depth": plate_metadata.depth,
         "bottom_plate_height": plate_metadata.height,
-        "bottom_cavity_plate_width": plate_metadata.cavity.width,
-        "bottom_cavity_plate_depth": plate_metadata.cavity.depth,
-        "bottom_cavity_plate_height": plate_metadata.cavity.height,
+        "bottom_cavity_plate_width": cavity.width,
+        "bottom_cavity_plate_depth": cavity.depth,
     }
     return read_gdml_with_replacements(dummy_gdml_path, replacements)
 
 
+def _castle_table1_replacements(castle_dimensions: AttrsDict) -> dict:
+    base = castle_dimensions.base
+    inner_cavity = castle_dimensions.inner_cavity
+    cavity = castle_dimensions.cavity
+    top = castle_dimensions.top
+    front = castle_dimensions.front
+
+    return {
+        "base_width_1": base.width,
+        "base_depth_1": base.depth,
+        "base_height_1": base.height,
+        "inner_cavity_width_1": inner_cavity.width,
+        "inner_cavity_depth_1": inner_cavity.depth,
+        "inner_cavity_height_1": inner_cavity.height,
+        "cavity_width_1": cavity.width,
+        "cavity_depth_1": cavity.depth,
+        "cavity_height_1": cavity.height,
+        "top_width_1": top.width,
+        "top_depth_1": top.depth,
+        "top_height_1": top.height,
+        "front_width_1": front.width,
+        "front_depth_1": front.depth,
+        "front_height_1": front.height,
+    }
+
+
+def _castle_table2_replacements(castle_dimensions: AttrsDict) -> dict:
+    base = castle_dimensions.base
+    inner_cavity = castle_dimensions.inner_cavity
+    top = castle_dimensions.top
+    copper_plate = castle_dimensions.copper_plate
+
+    return {
+        "base_width_2": base.width,
+        "base_depth_2": base.depth,
+        "base_height_2": base.height,
+        "inner_cavity_width_2": inner_cavity.width,
+        "inner_cavity_depth_2": inner_cavity.depth,
+        "inner_cavity_height_2": inner_cavity.height,
+        "top_width_2": top.width,
+        "top_depth_2": top.depth,
+        "top_height_2": top.height,
+        "copper_plate_width": copper_plate.width,
+        "copper_plate_depth": copper_plate.depth,
+        "copper_plate_height": copper_plate.height,
+    }
+
+
+# builders of the replacements for the lead_castle_table<table_num>_dummy.gdml
+# templates
+_CASTLE_REPLACEMENTS = {
+    1: _castle_table1_replacements,
+    2: _castle_table2_replacements,
+}
+
+
 def create_lead_castle(
     table_num: int, castle_dimensions: AttrsDict, from_gdml: bool = True
 ) -> geant4.LogicalVolume:
@@ -298,55 +362,80 @@ def create_lead_castle(
         msg = "cannot construct geometry without the gdml for now"
         raise NotImplementedError(msg)
 
-    if table_num not in [1, 2]:
+    if table_num not in _CASTLE_REPLACEMENTS:
         msg = f"Table number must be 1 or 2, not {table_num}"
         raise ValueError(msg)
 
-    dummy_gdml_path = (
-        resources.files("pygeomhades")
-        / "models"
-        / "dummy"
-        / f"lead_castle_table{table_num}_dummy.gdml"
-    )
-
-    if table_num == 1:
-        replacements = {
-            "base_width_1": castle_dimensions.base.width,
-            "base_depth_1": castle_dimensions.base.depth,
-            "base_height_1": castle_dimensions.base.height,
-            "inner_cavity_width_1": castle_dimensions.inner_cavity.width,
-            "inner_cavity_depth_1": castle_dimensions.inner_cavity.depth,
-            "inner_cavity_height_1": castle_dimensions.inner_cavity.height,
-            "cavity_width_1": castle_dimensions.cavity.width,
-            "cavity_depth_1": castle_dimensions.cavity.depth,
-            "cavity_height_1": castle_dimensions.cavity.height,
-            "top_width_1": castle_dimensions.top.width,
-            "top_depth_1": castle_dimensions.top.depth,
-            "top_height_1": castle_dimensions.top.height,
-            "front_width_1": castle_dimensions.front.width,
-            "front_depth_1": castle_dimensions.front.depth,
-            "front_height_1": castle_dimensions.front.height,
-        }
+    dummy_gdml_path = _DUMMY_DIR / f"lead_castle_table{table_num}_dummy.gdml"
 
-    elif table_num == 2:
-        replacements = {
-            "base_width_2": castle_dimensions.base.width,
-            "base_depth_2": castle_dimensions.base.depth,
-            "base_height_2": castle_dimensions.base.height,
-            "inner_cavity_width_2": castle_dimensions.inner_cavity.width,
-            "inner_cavity_depth_2": castle_dimensions.inner_cavity.depth,
-            "inner_cavity_height_2": castle_dimensions.inner_cavity.height,
-            "top_width_2": castle_dimensions.top.width,
-            "top_depth_2": castle_dimensions.top.depth,
-            "top_height_2": castle_dimensions.top.height,
-            "copper_plate_width": castle_dimensions.copper_plate.width,
-            "copper_plate_depth": castle_dimensions.copper_plate.depth,
-            "copper_plate_height": castle_dimensions.copper_plate.height,
-        }
+    replacements = _CASTLE_REPLACEMENTS[table_num](castle_dimensions)
 
     return read_gdml_with_replacements(dummy_gdml_path, replacements)
 
 
+def _am_hs1_source_replacements(source_dims: AttrsDict) -> dict:
+    return {
+        "source_height": source_dims.height,
+        "source_width": source_dims.width,
+        "source_capsule_height": source_dims.capsule.height,
+        "source_capsule_width": source_dims.capsule.width,
+        "window_source": source_dims.collimator.window,
+        "collimator_height": source_dims.collimator.height,
+        "collimator_depth": source_dims.collimator.depth,
+        "collimator_width": source_dims.collimator.width,
+        "collimator_beam_height": source_dims.collimator.beam_height,
+        "collimator_beam_width": source_dims.collimator.beam_width,
+    }
+
+
+def _am_hs6_source_replacements(source_dims: AttrsDict) -> dict:
+    return {
+        "source_height": source_dims.height,
+        "source_width": source_dims.width,
+        "source_capsule_height": source_dims.capsule.height,
+        "source_capsule_width": source_dims.capsule.width,
+        "source_capsule_depth": source_dims.capsule.depth,
+    }
+
+
+def _foil_source_replacements(source_dims: AttrsDict) -> dict:
+    return {
+        "source_height": source_dims.height,
+        "source_width": source_dims.width,
+        "source_foil_height": source_dims.foil.height,
+        "source_Alring_height": source_dims.al_ring.height,
+        "source_Alring_width_min": source_dims.al_ring.width_min,
+        "source_Alring_width_max": source_dims.al_ring.width_max,
+    }
+
+
+def _th_hs2_source_replacements(source_dims: AttrsDict) -> dict:
+    return {
+        "source_height": source_dims.height,
+        "source_width": source_dims.width,
+        "source_capsule_height": source_dims.capsule.height,
+        "source_capsule_width": source_dims.capsule.width,
+        "source_epoxy_height": source_dims.epoxy.height,
+        "source_epoxy_width": source_dims.epoxy.width,
+        "CuSource_holder_height": source_dims.copper.height,
+        "CuSource_holder_width": source_dims.copper.width,
+        "CuSource_holder_cavity_width": source_dims.copper.cavity_width,
+        "CuSource_holder_bottom_height": source_dims.copper.bottom_height,
+        "CuSource_holder_bottom_width": source_dims.copper.bottom_width,
+        "source_offset_height": source_dims.offset_height,
+    }
+
+
+# builders of the replacements for the source_<source_type>_dummy.gdml templates
+_SOURCE_REPLACEMENTS = {
+    "am_HS1": _am_hs1_source_replacements,
+    "am_HS6": _am_hs6_source_replacements,
+    "ba_HS4": _foil_source_replacements,
+    "co_HS5": _foil_source_replacements,
+    "th_HS2": _th_hs2_source_replacements,
+}
+
+
 def create_source(
     source_type: str,
     source_dims: AttrsDict,
@@ -412,67 +501,17 @@ def create_source(
         msg = "cannot construct geometry without the gdml for now"
         raise NotImplementedError(msg)
 
-    dummy_gdml_path = (
-        resources.files("pygeomhades")
-        / "models"
-        / "dummy"
-        / f"source_{source_type}_dummy.gdml"
-    )
-
-    if source_type == "am_HS1":
-        replacements = {
-            "source_height": source_dims.height,
-            "source_width": source_dims.width,
-            "source_capsule_height": source_dims.capsule.height,
-            "source_capsule_width": source_dims.capsule.width,
-            "window_source": source_dims.collimator.window,
-            "collimator_height": source_dims.collimator.height,
-            "collimator_depth": source_dims.collimator.depth,
-            "collimator_width": source_dims.collimator.width,
-            "collimator_beam_height": source_dims.collimator.beam_height,
-            "collimator_beam_width": source_dims.collimator.beam_width,
-        }
-
-    elif source_type == "am_HS6":
-        replacements = {
-            "source_height": source_dims.height,
-            "source_width": source_dims.width,
-            "source_capsule_height": source_dims.capsule.height,
-            "source_capsule_width": source_dims.capsule.width,
-            "source_capsule_depth": source_dims.capsule.depth,
-        }
-
-    elif source_type in ["ba_HS4", "co_HS5"]:
-        replacements = {
-            "source_height": source_dims.height,
-            "source_width": source_dims.width,
-            "source_foil_height": source_dims.foil.height,
-            "source_Alring_height": source_dims.al_ring.height,
-            "source_Alring_width_min": source_dims.al_ring.width_min,
-            "source_Alring_width_max": source_dims.al_ring.width_max,
-        }
+    dummy_gdml_path = _DUMMY_DIR / f"source_{source_type}_dummy.gdml"
 
-    elif source_type == "th_HS2":
-        replacements = {
-            "source_height": source_dims.height,
-            "source_width": source_dims.width,
-            "source_capsule_height": source_dims.capsule.height,
-            "source_capsule_width": source_dims.capsule.width,
-            "source_epoxy_height": source_dims.epoxy.height,
-            "source_epoxy_width": source_dims.epoxy.width,
-            "CuSource_holder_height": source_dims.copper.height,
-            "CuSource_holder_width": source_dims.copper.width,
-            "CuSource_holder_cavity_width": source_dims.copper.cavity_width,
-            "CuSource_holder_bottom_height": source_dims.copper.bottom_height,
-            "CuSource_holder_bottom_width": source_dims.copper.bottom_width,
-            "source_offset_height": source_dims.offset_height,
-        }
+    replacements_builder = _SOURCE_REPLACEMENTS.get(source_type)
 
-    else:
+    if replacements_builder is None:
         msg = f"source type of {source_type} is not defined."
         raise RuntimeError(msg)
 
-    return read_gdml_with_replacements(dummy_gdml_path, replacements)
+    return read_gdml_with_replacements(
+        dummy_gdml_path, replacements_builder(source_dims)
+    )
 
 
 def create_th_plate(
@@ -492,12 +531,7 @@ def create_th_plate(
         msg = "cannot construct geometry without the gdml for now"
         raise NotImplementedError(msg)
 
-    dummy_gdml_path = (
-        resources.files("pygeomhades")
-        / "models"
-        / "dummy"
-        / "source_th_HS2_plates_dummy.gdml"
-    )
+    dummy_gdml_path = _DUMMY_DIR / "source_th_HS2_plates_dummy.gdml"
     source = source_dims
 
     replacements = {
@@ -551,11 +585,10 @@ def create_source_holder(
         raise NotImplementedError(msg)
 
     source_holder = holder_dims
-    dummy_path = resources.files("pygeomhades") / "models" / "dummy"
 
-    if source_type in ["am_HS1", "ba_HS4", "co_HS5", "th_HS2"]:
+    if source_type in {"am_HS1", "ba_HS4", "co_HS5", "th_HS2"}:
         if meas_type == "lat":
-            dummy_gdml_path = dummy_path / "source_holder_lat_dummy.gdml"
+            dummy_gdml_path = _DUMMY_DIR / "source_holder_lat_dummy.gdml"
 
             replacements = {
                 "cavity_source_holder_height": source_holder.cavity_height,
@@ -565,34 +598,36 @@ def create_source_holder(
                 "cavity_source_holder_width": source_holder.cavity_width,
             }
         else:
-            dummy_gdml_path = dummy_path / "source_holder_dummy.gdml"
+            dummy_gdml_path = _DUMMY_DIR / "source_holder_dummy.gdml"
+            holder_source = source_holder.source
 
             replacements = {
-                "source_holder_top_plate_height": source_holder.source.top_plate_height,
-                "source_holder_top_height": source_holder.source.top_height,
-                "source_holder_topbottom_height": source_holder.source.top_bottom_height,
-                "source_holder_top_plate_width": source_holder.source.top_plate_width,
-                "source_holder_top_inner_width": source_holder.source.top_inner_width,
+                "source_holder_top_plate_height": holder_source.top_plate_height,
+                "source_holder_top_height": holder_source.top_height,
+                "source_holder_topbottom_height": holder_source.top_bottom_height,
+                "source_holder_top_plate_width": holder_source.top_plate_width,
+                "source_holder_top_inner_width": holder_source.top_inner_width,
                 "source_holder_inner_width": source_holder.inner_width,
-                "source_holder_bottom_inner_width": source_holder.source.bottom_inner_width,
+                "source_holder_bottom_inner_width": holder_source.bottom_inner_width,
                 "source_holder_outer_width": source_holder.outer_width,
                 "position_source_fromcryostat_z": source_z,
             }
 
     elif source_type == "am_HS6":
-        dummy_gdml_path = dummy_path / "source_holder_am_HS6_dummy.gdml"
+        dummy_gdml_path = _DUMMY_DIR / "source_holder_am_HS6_dummy.gdml"
+        holder_source = source_holder.source
 
         replacements = {
-            "source_holder_top_height": source_holder.source.top_height,
+            "source_holder_top_height": holder_source.top_height,
             "position_source_fromcryostat_z": source_z,
-            "source_holder_top_plate_height": source_holder.source.top_plate_height,
-            "source_holder_top_plate_width": source_holder.source.top_plate_width,
-            "source_holder_top_plate_depth": source_holder.source.top_plate_depth,
-            "source_holder_topbottom_height": source_holder.source.top_bottom_height,
-            "source_holder_top_inner_width": source_holder.source.top_inner_width,
-            "source_holder_top_inner_depth": source_holder.source.top_inner_depth,
+            "source_holder_top_plate_height": holder_source.top_plate_height,
+            "source_holder_top_plate_width": holder_source.top_plate_width,
+            "source_holder_top_plate_depth": holder_source.top_plate_depth,
+            "source_holder_topbottom_height": holder_source.top_bottom_height,
+            "source_holder_top_inner_width": holder_source.top_inner_width,
+            "source_holder_top_inner_depth": holder_source.top_inner_depth,
             "source_holder_inner_width": source_holder.inner_width,
-            "source_holder_bottom_inner_width": source_holder.source.bottom_inner_width,
+            "source_holder_bottom_inner_width": holder_source.bottom_inner_width,
             "source_holder_outer_width": source_holder.outer_width,
         }
 
@@ -621,9 +656,7 @@ def create_cryostat(
         msg = "cannot construct geometry without the gdml for now"
         raise NotImplementedError(msg)
 
-    dummy_gdml_path = (
-        resources.files("pygeomhades") / "models" / "dummy" / "cryostat_dummy.gdml"
-    )
+    dummy_gdml_path = _DUMMY_DIR / "cryostat_dummy.gdml"
 
     replacements = {
         "cryostat_height": cryostat_meta.height,
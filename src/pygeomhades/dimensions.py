@@ -42,7 +42,7 @@ def get_cryostat_metadata(det_type: str, order: int, xtal_slice: str) -> AttrsDi
         "position_cavity_from_bottom": 0.8,
         "position_from_bottom": 250.0,
     }
-    xl_orders = [3, 8, 9, 10, 11, 13, 14]
+    xl_orders = {3, 8, 9, 10, 11, 13, 14}
 
     if det_type == "bege":
         cryostat["height"] = 122.2
@@ -238,7 +238,7 @@ def get_source_holder_metadata(source_type: str, meas_type: str = "lat") -> Attr
         The measurement (for th only) either lat or top.
     """
 
-    if source_type in ["co_HS5", "ba_HS4", "am_HS1", "th_HS2"]:
+    if source_type in {"co_HS5", "ba_HS4", "am_HS1", "th_HS2"}:
         if meas_type == "lat":
             source_holder = {
                 "outer_width": 181.6,
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import copy
+import functools
 from importlib import resources
 
 from dbetto import AttrsDict, TextDB
 
+_DUMMY_DIR = resources.files("pygeomhades") / "configs" / "dummy"
+
+# dummy metadata used for each detector type, by the first letter of the name
+_DUMMY_TEMPLATES = {"B": "B99000A", "V": "V99000A"}
+
+
+@functools.cache
+def _dummy_db(name: str) -> TextDB:
+    """Open the (lazy) database of dummy metadata, shared by all proxies."""
+    return TextDB(_DUMMY_DIR / name, lazy=True)
+
 
 class PublicLegendMetadataProxy:
     def __init__(self):
-        dummy = TextDB(resources.files("pygeomhades") / "configs/dummy/diodes")
         self.hardware = AttrsDict(
-            {"detectors": {"germanium": {"diodes": _DiodeProxy(dummy)}}}
+            {"detectors": {"germanium": {"diodes": _DiodeProxy(_dummy_db("diodes"))}}}
         )
 
 
@@ -19,21 +30,24 @@ class _DiodeProxy:
         self.dummy_detectors = dummy_detectors
 
     def __getitem__(self, det_name: str) -> AttrsDict:
-        det = self.dummy_detectors[det_name[0] + "99000A"]
-        m = copy.copy(det)
+        det = self.dummy_detectors[_DUMMY_TEMPLATES[det_name[0]]]
+
+        # the template is shared by all detectors, it must not be modified
+        m = copy.deepcopy(det)
         m.name = det_name
         m.production.order = int(det_name[1:3])
         m.production.slice = "A"
         return m
 
     def keys(self):
-        return self.dummy_detector.keys()
+        # the database is lazy, files are only read when enumerating
+        self.dummy_detectors.scan()
+        return self.dummy_detectors.keys()
 
 
 class PublicHadesMetadataProxy:
     def __init__(self):
-        dummy = TextDB(resources.files("pygeomhades") / "configs/dummy/cryostat")
-        self.hardware = AttrsDict({"cryostat": _CryostatProxy(dummy)})
+        self.hardware = AttrsDict({"cryostat": _CryostatProxy(_dummy_db("cryostat"))})
 
 
 class _CryostatProxy:
@@ -41,10 +55,12 @@ class _CryostatProxy:
         self.dummy_cryostats = dummy_cryostats
 
     def __getitem__(self, det_name: str) -> AttrsDict:
-        det = self.dummy_cryostats[det_name[0] + "99000A"]
-        m = copy.copy(det)
+        det = self.dummy_cryostats[_DUMMY_TEMPLATES[det_name[0]]]
+        m = copy.deepcopy(det)
         m.name = det_name
         return m
 
     def keys(self):
+        # the database is lazy, files are only read when enumerating
+        self.dummy_cryostats.scan()
         return self.dummy_cryostats.keys()
@@ -18,7 +18,11 @@ def plot_profiles(
         coordinates of the profile, respectively. The `offset` field is a
         single number representing the offset of the profile from the center of
         the geometry.
-
+    title
+        Title of the plot.
+    show
+        If true, display the figure with :func:`matplotlib.pyplot.show`, this
+        blocks until the window is closed.
     """
     fig, ax = plt.subplots(figsize=(6, 8))
     plt.rcParams["font.size"] = 14
@@ -34,4 +38,7 @@ def plot_profiles(
     ax.set_title(title)
     ax.legend(fontsize=12)
 
+    if show:
+        plt.show()
+
     return fig, ax
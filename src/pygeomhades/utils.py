@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import tempfile
 from collections.abc import Mapping
 from pathlib import Path
@@ -85,9 +86,15 @@ def read_gdml_with_replacements(
     """
 
     gdml_text = dummy_gdml_path.read_text()
-
-    for key, val in replacements.items():
-        gdml_text = gdml_text.replace(key, f"{val:.1f}")
+    values = {key: f"{val:.1f}" for key, val in replacements.items()}
+
+    if values:
+        # longer keys first, so that a key contained in another one (e.g.
+        # "source_holder_height" in "cavity_source_holder_height") does not
+        # match inside it
+        keys = sorted(values, key=len, reverse=True)
+        pattern = re.compile("|".join(re.escape(key) for key in keys))
+        gdml_text = pattern.sub(lambda m: values[m.group(0)], gdml_text)
 
     with tempfile.NamedTemporaryFile("w+", suffix=".gdml") as f:
         f.write(gdml_text)
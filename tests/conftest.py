@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
@@ -11,14 +12,35 @@ from pygeomhades.metadata import PublicHadesMetadataProxy, PublicLegendMetadataP
 public_geom = os.getenv("LEGEND_METADATA", "") == ""
 
 
-@pytest.fixture(scope="session")
-def metadatas():
+@functools.cache
+def _load_metadatas():
+    # shared by the fixture and the collection-time geometry generation
     if public_geom:
         return PublicLegendMetadataProxy(), PublicHadesMetadataProxy()
     return LegendMetadata(), HadesMetadata()
 
 
+@pytest.fixture(scope="session")
+def metadatas():
+    return _load_metadatas()
+
+
+@pytest.fixture(scope="session")
+def public_legend_meta():
+    return PublicLegendMetadataProxy()
+
+
+@pytest.fixture(scope="session")
+def public_hades_meta():
+    return PublicHadesMetadataProxy()
+
+
 def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if metafunc.function.__name__ == "test_construct_am_hs6_top_dlt":
+        # one case per detector in the cryostat metadata
+        _, hmeta = _load_metadatas()
+        metafunc.parametrize("det", hmeta.hardware.cryostat.keys())
+
     if "gdml_file" not in metafunc.fixturenames:
         return
 
@@ -30,15 +52,11 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
 
     from pygeomhades import core
     from pygeomhades.core import construct
-    from pygeomhades.metadata import PublicHadesMetadataProxy, PublicLegendMetadataProxy
 
     # use pytest's base temp dir for the session
     outdir = metafunc.config._tmp_path_factory.mktemp("gdml")
 
-    if public_geom:
-        _, hmeta = PublicLegendMetadataProxy(), PublicHadesMetadataProxy()
-    else:
-        _, hmeta = LegendMetadata(), HadesMetadata()
+    _, hmeta = _load_metadatas()
 
     files: list[Path] = []
 
@@ -5,11 +5,10 @@ import os
 import pygeomtools
 import pytest
 from dbetto import AttrsDict
-from legendmeta import HadesMetadata
 from pyg4ometry import geant4
 
+from pygeomhades import core, create_volumes
 from pygeomhades.core import construct, translate_to_detector_frame
-from pygeomhades.metadata import PublicHadesMetadataProxy
 
 public_geom = os.getenv("LEGEND_METADATA", "") == ""
 
@@ -106,13 +105,8 @@ def test_construct(config: AttrsDict, assert_copper_plate: bool):
         assert "Copper_plate_PV" in reg.physicalVolumeDict
 
 
-@pytest.mark.parametrize(
-    "det",
-    (
-        PublicHadesMetadataProxy() if public_geom else HadesMetadata()
-    ).hardware.cryostat.keys(),
-)
 def test_construct_am_hs6_top_dlt(det: str):
+    # det is parametrized in conftest.py, over the cryostat metadata
     # skip the special detectors
     if det in ["V02162B", "V02160A", "V07646A", "V06649A"] and public_geom:
         pytest.skip("public geometry: special detector not available")
@@ -134,6 +128,62 @@ def test_construct_am_hs6_top_dlt(det: str):
     pygeomtools.geometry.check_registry_sanity(reg, reg)
 
 
+def test_construct_invalid_source(monkeypatch):
+    # the source request must be rejected before any volume is built
+    def _not_reached(*args, **kwargs):
+        pytest.fail("geometry was built before the source was validated")
+
+    monkeypatch.setattr(create_volumes, "create_vacuum_cavity", _not_reached)
+    monkeypatch.setattr(create_volumes, "read_gdml_with_replacements", _not_reached)
+    monkeypatch.setattr(core, "make_hpge", _not_reached)
+
+    config = AttrsDict(
+        {
+            "detector": "V07302A",
+            "campaign": "c1",
+            "measurement": "co_HS5_lat_dlt",
+            "daq_settings": {"flashcam": {"card_interface": "efb2"}},
+            "source_position": {"phi_in_deg": 0.0, "r_in_mm": 30, "z_in_mm": 60.0},
+        }
+    )
+    with pytest.raises(NotImplementedError):
+        construct(config, public_geometry=public_geom)
+
+    config["source_position"] = None
+    with pytest.raises(RuntimeError):
+        construct(config, public_geometry=public_geom)
+
+
+def test_construct_world_size():
+    config = AttrsDict(
+        {
+            "detector": "V07302A",
+            "campaign": "c1",
+            "measurement": "am_HS6_top_dlt",
+            "daq_settings": {"flashcam": {"card_interface": "efb2"}},
+        }
+    )
+    reg = construct(config, public_geometry=public_geom, world_size_in_m=3)
+
+    assert float(reg.solidDict["world"].pX) == 3
+    assert float(reg.solidDict["lab"].pX) < 3
+    pygeomtools.geometry.check_registry_sanity(reg, reg)
+
+
+@pytest.mark.parametrize("world_size_in_m", [-1, 0, 0.5])
+def test_construct_world_too_small(world_size_in_m: float):
+    config = AttrsDict(
+        {
+            "detector": "V07302A",
+            "campaign": "c1",
+            "measurement": "am_HS6_top_dlt",
+            "daq_settings": {"flashcam": {"card_interface": "efb2"}},
+        }
+    )
+    with pytest.raises(ValueError, match="world_size_in_m"):
+        construct(config, public_geometry=public_geom, world_size_in_m=world_size_in_m)
+
+
 def test_translate_to_detector_frame():
     # basic test for non HS1
     pos = AttrsDict({"phi_in_deg": 0.0, "r_in_mm": 0.0, "z_in_mm": 38.0})
@@ -5,6 +5,7 @@ from dbetto import AttrsDict
 from pyg4ometry import geant4
 
 from pygeomhades.create_volumes import (
+    create_bottom_plate,
     create_holder,
     create_th_plate,
     create_vacuum_cavity,
@@ -112,3 +113,31 @@ def test_create_th_plate():
 
     with pytest.raises(NotImplementedError):
         _ = create_th_plate(source_dims, from_gdml=False)
+
+
+def test_create_bottom_plate():
+    plate = AttrsDict(
+        {
+            "width": 750,
+            "depth": 750,
+            "height": 15,
+            "cavity": {"width": 120, "depth": 940, "height": 20},
+        }
+    )
+
+    lv = create_bottom_plate(plate, from_gdml=True)
+
+    assert isinstance(lv, geant4.LogicalVolume)
+    assert isinstance(lv.solid, geant4.solid.ExtrudedSolid)
+    assert lv.name == "Bottom_plate"
+
+    # 750 x 750 x 15 plate, minus the 120 x 470 part of the cavity inside it
+    assert lv.solid.mesh().volume() == pytest.approx(750 * 750 * 15 - 120 * 470 * 15)
+
+    # a cavity that does not cut through the plate cannot be extruded
+    plate.cavity.height = 10
+    with pytest.raises(ValueError):
+        create_bottom_plate(plate, from_gdml=True)
+
+    with pytest.raises(NotImplementedError):
+        _ = create_bottom_plate(plate, from_gdml=False)
@@ -2,14 +2,36 @@ from __future__ import annotations
 
 from dbetto import AttrsDict
 
-from pygeomhades.metadata import PublicHadesMetadataProxy, PublicLegendMetadataProxy
 
+def test_legend_metada_proxy(public_legend_meta):
+    assert isinstance(
+        public_legend_meta.hardware.detectors.germanium.diodes["V123456A"], AttrsDict
+    )
 
-def test_legend_metada_proxy():
-    lmeta = PublicLegendMetadataProxy()
-    assert isinstance(lmeta.hardware.detectors.germanium.diodes["V123456A"], AttrsDict)
+    # the detectors share a template, but not their production info
+    diodes = public_legend_meta.hardware.detectors.germanium.diodes
+    first = diodes["V07302A"]
+    second = diodes["V02160A"]
+    assert first.name == "V07302A"
+    assert first.production.order == 7
+    assert second.production.order == 2
 
+    # nested fields are not shared with the template either
+    first.production.enrichment.val = 0.5
+    assert second.production.enrichment.val != 0.5
+    assert diodes.dummy_detectors["V99000A"].production.enrichment.val != 0.5
+    assert diodes.dummy_detectors["V99000A"].name == "V99000A"
 
-def test_hades_metada_proxy():
-    lmeta = PublicHadesMetadataProxy()
-    assert isinstance(lmeta.hardware.cryostat["V123456A"], AttrsDict)
+    assert set(diodes.keys()) == {"B99000A", "V99000A"}
+
+
+def test_hades_metada_proxy(public_hades_meta):
+    assert isinstance(public_hades_meta.hardware.cryostat["V123456A"], AttrsDict)
+
+    cryostat = public_hades_meta.hardware.cryostat["V07302A"]
+    cryostat.detector.position = 0.0
+    templates = public_hades_meta.hardware.cryostat.dummy_cryostats
+    assert templates["V99000A"].detector.position == 8.0
+
+    # the dummy database is lazy, but can still be enumerated
+    assert set(public_hades_meta.hardware.cryostat.keys()) == {"B99000A", "V99000A"}
@@ -4,16 +4,15 @@ from importlib import resources
 
 import numpy as np
 import pyg4ometry
+import pytest
 
 from pygeomhades import utils
-from pygeomhades.metadata import PublicLegendMetadataProxy
 
 
-def test_merge_config():
-    meta = PublicLegendMetadataProxy()
-
+def test_merge_config(public_legend_meta):
     hpge_meta = utils.merge_configs(
-        meta.hardware.detectors.germanium.diodes["V07302A"], {"dimensions": 1}
+        public_legend_meta.hardware.detectors.germanium.diodes["V07302A"],
+        {"dimensions": 1},
     )
 
     assert hpge_meta.hades.dimensions == 1
@@ -35,23 +34,26 @@ def test_read_gdml_with_replacements():
 
     assert isinstance(lv, pyg4ometry.geant4.LogicalVolume)
 
+    # each call returns a new volume, owned by its own registry
+    lv_again = utils.read_gdml_with_replacements(dummy_gdml_path, replacements)
+    assert lv_again is not lv
+    assert lv_again.registry is not lv.registry
 
-def test_parse_measurement_basic():
-    out = utils.parse_measurement("cs_HS2_bottom_foo")
-
-    assert out.source == "cs_HS2"
-    assert out.position == "bottom"
-    assert out.id == "foo"
-
-    out = utils.parse_measurement("am_HS1_top_dlt")
-
-    assert out.source == "am_HS1"
-    assert out.position == "top"
-    assert out.id == "dlt"
 
-    out = utils.parse_measurement("am_HS6_top_dlt")
+@pytest.mark.parametrize(
+    ("measurement", "source", "position", "meas_id"),
+    [
+        ("cs_HS2_bottom_foo", "cs_HS2", "bottom", "foo"),
+        ("am_HS1_top_dlt", "am_HS1", "top", "dlt"),
+        ("am_HS6_top_dlt", "am_HS6", "top", "dlt"),  # no renaming
+    ],
+)
+def test_parse_measurement_basic(measurement, source, position, meas_id):
+    out = utils.parse_measurement(measurement)
 
-    assert out.source == "am_HS6"  # no renaming
+    assert out.source == source
+    assert out.position == position
+    assert out.id == meas_id
 
 
 def test_profile():
@@ -70,8 +72,8 @@ def test_profile():
 
     profile = utils.get_profile(polycone)
 
-    assert profile["r"] == [2, 10, 10, 3, 2]
-    assert profile["z"] == [0, 10, 10, 0, 0]
+    np.testing.assert_allclose(profile["r"], [2, 10, 10, 3, 2])
+    np.testing.assert_allclose(profile["z"], [0, 10, 10, 0, 0])
 
     generic_polycone = pyg4ometry.geant4.solid.GenericPolycone(
         "test_generic_polycone",
@@ -83,5 +85,5 @@ def test_profile():
         registry=reg,
     )
     profile = utils.get_profile(generic_polycone)
-    assert profile["r"] == [0, 0, 10, 0, 0]
-    assert profile["z"] == [2, 2, 5, 5, 2]
+    np.testing.assert_allclose(profile["r"], [0, 0, 10, 0, 0])
+    np.testing.assert_allclose(profile["z"], [2, 2, 5, 5, 2])